@@ -7,7 +7,9 @@ Edit this file directly and reinstall to change defaults.
 # Audio settings
 SAMPLE_RATE = 16000
 CHANNELS = 1
-CHUNK_SIZE = 1024
+CHUNK_SIZE = 256      # frames per audio callback (16ms at 16kHz); VAD reacts per block
+LATENCY = "low"       # PortAudio latency hint: "low", "high" or seconds
+BUFFER_SECONDS = 300  # initial recording buffer; grows if a recording runs longer
 
 # Whisper model - see https://github.com/openai/whisper#available-models-and-languages
 # tiny   - ~75MB  - fastest, lowest quality
@@ -17,6 +19,12 @@ CHUNK_SIZE = 1024
 # large  - ~3GB   - best quality
 MODEL = "tiny"
 
+# Transcription backend
+# "auto"           - faster-whisper if installed, otherwise openai-whisper
+# "whisper"        - openai-whisper (PyTorch), FP16 on CUDA, FP32 on CPU
+# "faster-whisper" - CTranslate2, FP16 on CUDA, int8 on CPU (same as --fast-mode)
+BACKEND = "auto"
+
 # Default language - set to None for auto-detect
 # Examples: "en", "es", "fr", "de", "it", "pt", "zh", "ja", "ko"
 LANGUAGE = "en"
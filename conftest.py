@@ -6,6 +6,122 @@ Shared pytest fixtures and configuration
 import pytest
 import tempfile
 import os
+import io
+import sys
+import time
+import contextlib
+import subprocess
+
+# Directory holding listen.py; spawned interpreters run from here
+HERE = os.path.dirname(os.path.abspath(__file__))
+PY = sys.executable
+LISTEN = os.path.join(HERE, 'listen.py')
+
+# Total wall time allowed for spawned listen.py processes. Once spent, the
+# remaining spawning tests are skipped so a hanging CLI cannot stall the suite.
+SPAWN_BUDGET = float(os.environ.get('LISTEN_TEST_SPAWN_BUDGET_SEC', '60'))
+spawn_time = [0.0]
+
+
+def pytest_runtest_setup(item):
+    """Skip tests that spawn listen.py once the spawn budget is used up"""
+    if 'run_listen' in item.fixturenames and spawn_time[0] > SPAWN_BUDGET:
+        pytest.skip(f'listen.py spawn budget used up ({spawn_time[0]:.1f}s > '
+                    f'LISTEN_TEST_SPAWN_BUDGET_SEC={SPAWN_BUDGET:g})')
+
+
+class ListenRunner:
+    """Run listen.main() in this interpreter instead of spawning listen.py"""
+
+    def __init__(self, module):
+        self.listen = module
+
+    def run(self, argv):
+        """Run the CLI with argv; returns a CompletedProcess like subprocess.run(capture_output=True, text=True)"""
+        # main() rebinds module globals (modes, status file, ...); put them back afterwards
+        saved = dict(vars(self.listen))
+        old_argv = sys.argv
+        sys.argv = ['listen.py'] + list(argv)
+        out, err = io.StringIO(), io.StringIO()
+        returncode = 0
+        try:
+            with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+                try:
+                    self.listen.main()
+                except SystemExit as e:
+                    if isinstance(e.code, str):
+                        print(e.code, file=sys.stderr)
+                        returncode = 1
+                    else:
+                        returncode = e.code or 0
+        finally:
+            sys.argv = old_argv
+            vars(self.listen).update(saved)
+        return subprocess.CompletedProcess(argv, returncode, out.getvalue(), err.getvalue())
+
+
+@pytest.fixture(scope='session')
+def listen_cli():
+    """CLI runner sharing one imported listen module across the whole session"""
+    import listen
+    return ListenRunner(listen)
+
+
+@pytest.fixture
+def listen_module():
+    """The imported listen module; patch its globals with monkeypatch.setattr"""
+    import listen
+    return listen
+
+
+@pytest.fixture
+def listen_mode(listen_module, monkeypatch):
+    """Set listen globals for one test: listen_mode(json_mode=True, ...)"""
+    def set_mode(**globals_):
+        for name, value in globals_.items():
+            monkeypatch.setattr(listen_module, name, value)
+        return listen_module
+    return set_mode
+
+
+@pytest.fixture(scope='session')
+def run_listen():
+    """Spawn listen.py in a fresh interpreter, for tests that need a real process"""
+    def run(args, python_flags=('-E',), **kwargs):
+        # -E skips PYTHON* env handling; callers that need even less (no site,
+        # -I) pass their own flags. -I implies -P, which hides config.py.
+        # Capture both streams unless the caller routes them (e.g. DEVNULL)
+        if 'stdout' not in kwargs and 'stderr' not in kwargs:
+            kwargs.setdefault('capture_output', True)
+        kwargs.setdefault('text', True)
+        kwargs.setdefault('cwd', HERE)
+        # Every spawned case should fail or finish fast; a hang is a bug
+        kwargs.setdefault('timeout', 2)
+        t0 = time.monotonic()
+        try:
+            return subprocess.run([PY, *python_flags, LISTEN, *args], **kwargs)
+        finally:
+            spawn_time[0] += time.monotonic() - t0
+    return run
+
+
+# Help and version text never change within a run; render each once per session
+@pytest.fixture(scope='session')
+def help_output(listen_cli):
+    """Result of `listen --help`"""
+    return listen_cli.run(['--help'])
+
+
+@pytest.fixture(scope='session')
+def help_output_short(listen_cli):
+    """Result of `listen -h`"""
+    return listen_cli.run(['-h'])
+
+
+@pytest.fixture(scope='session')
+def version_output(listen_cli):
+    """Result of `listen --version`"""
+    return listen_cli.run(['--version'])
 
 
 @pytest.fixture
@@ -41,6 +157,14 @@ def temp_audio_file():
         os.unlink(tmp_path)
 
 
+@pytest.fixture(scope='session')
+def empty_wav(tmp_path_factory):
+    """Path of a zero-byte .wav, created once per session (tests must not modify it)"""
+    path = tmp_path_factory.mktemp('audio') / 'empty.wav'
+    path.touch()
+    return str(path)
+
+
 @pytest.fixture
 def temp_directory():
     """Create a temporary directory for testing"""
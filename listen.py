@@ -1,18 +1,69 @@
 #!/usr/bin/env python3
-import sys, os, tempfile, wave, time, threading, queue, fcntl, termios, re, signal, argparse
+import sys
+
+__version__ = '2.1.0'
+
+# Help text
+HELP = """usage: listen [MODE] [OPTIONS]
+
+Modes:
+  (default)           Record audio from microphone and transcribe
+  -f, --file FILE     Transcribe audio from file (mp3, wav, m4a, etc.)
+  --batch FILE...     Transcribe several files, loading the model once
+
+Options:
+  -l, --language LANG     Language code (default: {lang})
+  -m, --model MODEL       Whisper model (default: {model})
+  --signal-mode           Use SIGUSR1 signal to stop recording
+  --vad SECONDS           Auto-stop after N seconds of silence
+  --codevoice             Full-width visual mode for code voice input
+  --fast-mode             Force faster-whisper (default when installed, see config.BACKEND)
+  --batch-size N          Decode N chunks at once for files over 60s (faster-whisper)
+  --device DEVICE         Inference device, e.g. cpu or cuda (default: auto)
+  --compute-type TYPE     faster-whisper precision, e.g. int8, float16 (default: auto)
+  --version               Show version and exit
+  -v, --verbose           Verbose output
+
+Scripting options:
+  -q, --quiet             Suppress UI, output only transcription
+  -j, --json              Output in JSON format
+  -o, --output FILE       Write transcription to file
+  --status-file FILE      Write real-time status to JSON file
+
+Recording controls:
+  (default) Press SPACE to stop recording
+  (signal)  Send SIGUSR1 to process (kill -SIGUSR1 <pid>)
+  (vad)     Auto-stop after silence duration
+
+Configuration:
+  Edit config.py and reinstall to change defaults
+  CLI arguments override config.py values"""
+
+
+def print_help_or_version(argv):
+    """Print help or version if argv asks for it; return True when handled"""
+    # Help anywhere on the command line wins, before any other work
+    if '-h' in argv or '--help' in argv:
+        import config
+        print(HELP.format(lang=config.LANGUAGE, model=config.MODEL))
+        return True
+    if argv and argv[0] == '--version':
+        print(f"listen {__version__}")
+        return True
+    return False
+
+
+# --help/--version answer before numpy and the rest are even imported
+if __name__ == '__main__' and print_help_or_version(sys.argv[1:]):
+    sys.exit(0)
+
+import os, time, threading, math
+import importlib.util
 import numpy as np
-import sounddevice as sd
-import whisper
 import config
 
-# Try to import faster-whisper for performance optimization
-try:
-    from faster_whisper import WhisperModel
-    FASTER_WHISPER_AVAILABLE = True
-except ImportError:
-    FASTER_WHISPER_AVAILABLE = False
-
-__version__ = '2.1.0'
+# faster-whisper is optional; only check it is installed here, load_model() imports it
+FASTER_WHISPER_AVAILABLE = importlib.util.find_spec('faster_whisper') is not None
 
 # ANSI escape codes
 CLR = '\033[K'
@@ -22,65 +73,87 @@ YEL = '\033[93m'
 MAG = '\033[95m'  # Magenta/Purple
 RST = '\033[0m'
 
+# Simple-mode meter strings, indexed by number of filled cells
+BARS = ['=' * n + ' ' * (10 - n) for n in range(11)]
+
+# UI refresh period (seconds) and ticks per on/off phase of the processing blink
+UI_TICK = 0.1
+BLINK_TICKS = 3
+
+# Files shorter than this are a single window or two; batching does not pay off
+BATCH_MIN_SECONDS = 60
+
+# Minimum seconds between --status-file rewrites while recording
+STATUS_INTERVAL = 0.25
+# Wall-clock time = monotonic time + EPOCH_OFFSET (one clock read per record tick)
+EPOCH_OFFSET = time.time() - time.monotonic()
+
 # Audio configuration (from config.py)
 SAMPLE_RATE = config.SAMPLE_RATE
 CHANNELS = config.CHANNELS
 CHUNK_SIZE = config.CHUNK_SIZE
+LATENCY = config.LATENCY
+BUFFER_SECONDS = config.BUFFER_SECONDS
 DTYPE = 'float32'
 
-# Recording state
-rec = []
+# Level meter time constant (seconds); the per-block EMA weight follows from
+# the block size, so the meter responds the same whatever CHUNK_SIZE is
+LEVEL_TAU = 0.15
+LEVEL_ALPHA = 1.0 - math.exp(-CHUNK_SIZE / (SAMPLE_RATE * LEVEL_TAU))
+
+# Recording state: audio_cb appends to rec_buf, rec_frames is the write cursor
+rec_buf = None
+rec_frames = [0]
+overflows = [0]  # input overflows (dropped audio) in the current recording
 lvl = [0.0]
+level_bucket = [-1]
+draw_event = threading.Event()
+last_draw = [None]  # key of the last frame drawn; None forces the next redraw
+term_cols = [None]  # cached terminal width for --codevoice; SIGWINCH clears it
 pct = [0.0]
+anim_stop = [None]  # stops the running processing animation (timer or thread)
 verbose = False
 is_tty = sys.stdout.isatty()
 stdin_is_tty = sys.stdin.isatty()
-signal_stop = [False]
+# draw() writes straight to this fd: no TextIOWrapper lock and no flush per frame
+try:
+    out_fd = (sys.stdout if is_tty else sys.stderr).fileno()
+except (AttributeError, OSError, ValueError):
+    out_fd = None  # stream replaced by something without a real fd
+stop_evt = threading.Event()  # set by SPACE, SIGUSR1, VAD or timeout
 signal_mode = False
 vad_enabled = False
 vad_silence_duration = config.VAD_DEFAULT_DURATION
 vad_threshold = config.VAD_THRESHOLD
 
+# Per-block VAD state, updated by audio_cb (thresholds are set in record())
+vad_threshold_sq = vad_threshold * vad_threshold
+vad_silence_frames = 0
+vad_speech = [False]
+vad_silent = [0]
+
 # Scripting mode flags
 quiet_mode = False
 json_mode = False
 output_file = None
 codevoice_mode = False
 status_file = None
+status_tmp = None          # f'{status_file}.tmp', built once in main()
+status_encode = [None]     # cached JSONEncoder.encode, created on first status write
+# Status writer thread: producers drop the latest dict in the mailbox, the thread writes it
+status_mbox = [None]
+status_written = [None]    # last dict written, so the mailbox is never written twice
+status_evt = threading.Event()
+status_lock = threading.Lock()
+status_writer = None
 fast_mode = False
-preloaded_model = None
-
-# Help text
-HELP = """usage: listen [MODE] [OPTIONS]
-
-Modes:
-  (default)           Record audio from microphone and transcribe
-  -f, --file FILE     Transcribe audio from file (mp3, wav, m4a, etc.)
-
-Options:
-  -l, --language LANG     Language code (default: {lang})
-  -m, --model MODEL       Whisper model (default: {model})
-  --signal-mode           Use SIGUSR1 signal to stop recording
-  --vad SECONDS           Auto-stop after N seconds of silence
-  --codevoice             Full-width visual mode for code voice input
-  --fast-mode             Use faster-whisper for 3-4x speed (requires faster-whisper)
-  --version               Show version and exit
-  -v, --verbose           Verbose output
-
-Scripting options:
-  -q, --quiet             Suppress UI, output only transcription
-  -j, --json              Output in JSON format
-  -o, --output FILE       Write transcription to file
-  --status-file FILE      Write real-time status to JSON file
+fast_mode_forced = False  # --fast-mode / BACKEND = "faster-whisper": no fallback to openai-whisper
+batch_size = 1  # >1: batched faster-whisper inference for long files
+device_override = None        # --device: skip CUDA autodetection
+compute_type_override = None  # --compute-type: faster-whisper quantization
+model_cache = {}  # (backend, model name) -> loaded model
+preload_thread = None
 
-Recording controls:
-  (default) Press SPACE to stop recording
-  (signal)  Send SIGUSR1 to process (kill -SIGUSR1 <pid>)
-  (vad)     Auto-stop after silence duration
-
-Configuration:
-  Edit config.py and reinstall to change defaults
-  CLI arguments override config.py values"""
 
 def log(msg):
     if verbose:
@@ -88,28 +161,71 @@ def log(msg):
 
 
 def write_status(data):
-    """Write status to JSON file atomically"""
+    """Publish status; written by the status thread if running, else inline"""
     if not status_file:
         return
+    status_mbox[0] = data
+    if status_writer is None:
+        flush_status()
+    else:
+        status_evt.set()
+
+
+def flush_status():
+    """Write the pending status, if any (status thread and atexit)"""
+    with status_lock:
+        data = status_mbox[0]
+        if data is not None and data is not status_written[0]:
+            save_status(data)
+            status_written[0] = data
+
+
+def status_loop():
+    """Status thread: coalesce updates so file I/O never blocks the record loop"""
+    while True:
+        status_evt.wait()
+        status_evt.clear()
+        flush_status()
+
+
+def start_status_writer():
+    """Start the status thread and make sure the final status lands on exit"""
+    global status_writer
+    import atexit
+    atexit.register(flush_status)
+    status_writer = threading.Thread(target=status_loop, daemon=True)
+    status_writer.start()
+
 
+def save_status(data):
+    """Write status to JSON file atomically"""
     try:
-        import json
+        if status_encode[0] is None:
+            import json
+            status_encode[0] = json.JSONEncoder(ensure_ascii=False).encode
+        payload = status_encode[0](data).encode('utf-8')
         # Atomic write: write to temp file then rename
-        temp_file = f"{status_file}.tmp"
-        with open(temp_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False)
+        temp_file = status_tmp or f"{status_file}.tmp"
+        fd = os.open(temp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            os.write(fd, payload)
+        finally:
+            os.close(fd)
         os.replace(temp_file, status_file)
         log(f'Status written: {data.get("status")}')
     except Exception as e:
         log(f'Error writing status file: {e}')
 
 
-def output_transcription(text, lang, model_name, duration=None):
-    """Handle transcription output based on flags"""
-    import json as json_lib
+def output_transcription(text, lang, model_name, duration=None, source=None, append=False):
+    """Handle transcription output based on flags
 
+    source labels the result with its input file (--batch); append adds to
+    the -o file instead of truncating it.
+    """
     # Prepare data
     if json_mode:
+        import json as json_lib
         data = {
             "transcription": text,
             "language": lang,
@@ -117,17 +233,24 @@ def output_transcription(text, lang, model_name, duration=None):
         }
         if duration:
             data["duration"] = duration
+        if source is not None:
+            data["file"] = source
         output_text = json_lib.dumps(data, ensure_ascii=False)
+    elif source is not None:
+        output_text = f'{source}: {text}'
     else:
         output_text = text
 
     # Output to stdout
-    print(output_text, flush=True)
+    sys.stdout.write(output_text + '\n')
+    sys.stdout.flush()
 
     # Write to file if specified
     if output_file:
         try:
-            with open(output_file, 'w', encoding='utf-8') as f:
+            with open(output_file, 'a' if append else 'w', encoding='utf-8') as f:
+                if append:
+                    f.write('\n')
                 f.write(output_text)
             if not quiet_mode and not json_mode:
                 print(f'Written to {output_file}', file=sys.stderr)
@@ -137,25 +260,69 @@ def output_transcription(text, lang, model_name, duration=None):
 
 def signal_handler(signum, frame):
     """Handle SIGUSR1 to stop recording gracefully"""
-    global signal_stop
-    signal_stop[0] = True
+    # Set from a helper thread: the handler runs on the main thread, which may
+    # already hold the event's internal lock inside stop_evt.wait()
+    threading.Thread(target=stop_evt.set, daemon=True).start()
     log(f'Received signal {signum}, stopping recording')
 
 
-def audio_cb(data, frames, t, status):
-    global np
-    rec.append(data.copy())
-    lvl[0] = float(np.sqrt(np.mean(data**2)))
+def winch_handler(signum, frame):
+    """Handle SIGWINCH: re-read the terminal width on the next draw"""
+    term_cols[0] = None
 
 
-def kbd_listen(q):
+def audio_cb(data, frames, t, status):
+    global rec_buf
+    if status and status.input_overflow:
+        # PortAudio dropped input before this block: the callback fell behind
+        overflows[0] += 1
+        log(f'Input overflow ({overflows[0]} so far): audio dropped')
+    # Copy into the preallocated buffer; only allocates on (rare) overflow
+    n = len(data)
+    i = rec_frames[0]
+    if i + n > len(rec_buf):
+        # Double so growth stays amortized O(1) per sample
+        grown = np.empty((2 * len(rec_buf) + n, CHANNELS), dtype=DTYPE)
+        grown[:i] = rec_buf[:i]
+        rec_buf = grown
+    rec_buf[i:i + n] = data
+    rec_frames[0] = i + n
+
+    # Smoothed mean square (no temporary array); readers take the root once per tick
+    flat = data.reshape(-1)
+    mean_sq = float(np.dot(flat, flat)) / flat.size
+    lvl[0] += LEVEL_ALPHA * (mean_sq - lvl[0])
+
+    # Wake the UI only when the meter moves by at least 0.001
+    bucket = int(math.sqrt(lvl[0]) * 1000)
+    if bucket != level_bucket[0]:
+        level_bucket[0] = bucket
+        draw_event.set()
+
+    # VAD on every block: silence is counted in samples, not UI ticks
+    if vad_enabled:
+        if mean_sq >= vad_threshold_sq:
+            if not vad_speech[0] or vad_silent[0]:
+                log(f'Speech detected (level: {math.sqrt(mean_sq):.4f})')
+            vad_speech[0] = True
+            vad_silent[0] = 0
+        elif vad_speech[0]:
+            vad_silent[0] += n
+            if vad_silent[0] >= vad_silence_frames and not stop_evt.is_set():
+                log(f'Recording stopped after {vad_silent[0] / SAMPLE_RATE:.2f}s of silence')
+                stop_evt.set()
+
+
+def kbd_listen(wake_fd):
+    """Stop recording on SPACE; exits as soon as wake_fd becomes readable"""
     if not stdin_is_tty:
         return
 
+    import selectors, termios
+
     try:
         fd = sys.stdin.fileno()
         old = termios.tcgetattr(fd)
-        flg = fcntl.fcntl(fd, fcntl.F_GETFL)
     except (termios.error, OSError):
         # Termux or environments where terminal control is not available
         log('Terminal control not available, keyboard listener disabled')
@@ -165,19 +332,33 @@ def kbd_listen(q):
         new = termios.tcgetattr(fd)
         new[3] = new[3] & ~termios.ICANON & ~termios.ECHO
         termios.tcsetattr(fd, termios.TCSANOW, new)
-        fcntl.fcntl(fd, fcntl.F_SETFL, flg | os.O_NONBLOCK)
 
-        while True:
-            try:
-                if sys.stdin.read(1) == ' ':
-                    q.put(1)
+        # Block with no timeout: a key press or record()'s wake byte ends the wait
+        sel = selectors.DefaultSelector()
+        sel.register(fd, selectors.EVENT_READ)
+        sel.register(wake_fd, selectors.EVENT_READ)
+
+        listening = True
+        while listening:
+            for key, _ in sel.select():
+                if key.fd == wake_fd:
+                    # Recording ended some other way (signal, VAD, timeout)
+                    listening = False
+                    break
+                # Raw read of whatever is pending, bypassing the TextIOWrapper
+                chunk = os.read(fd, 64)
+                if not chunk:
+                    # Terminal went away; it would stay readable forever
+                    listening = False
+                    break
+                if b' ' in chunk:
+                    log('SPACE pressed, stopping recording')
+                    stop_evt.set()
+                    listening = False
                     break
-            except (IOError, OSError, BlockingIOError):
-                pass
-            time.sleep(0.005)
 
+        sel.close()
         termios.tcsetattr(fd, termios.TCSAFLUSH, old)
-        fcntl.fcntl(fd, fcntl.F_SETFL, flg)
     except Exception as e:
         log(f'Keyboard listener error: {e}')
         pass
@@ -189,43 +370,58 @@ def draw(level, txt='Listening', hint='', fullwidth=False):
     if quiet_mode or json_mode:
         return
 
-    out = sys.stderr if not is_tty else sys.stdout
-    hint_str = f'  {MAG}{hint}{RST}' if hint else ''
-
     if fullwidth:
         # Full-width codevoice mode
-        try:
-            import shutil
-            terminal_width = shutil.get_terminal_size().columns
-        except:
-            terminal_width = 80
+        if term_cols[0] is None:
+            try:
+                import shutil
+                term_cols[0] = shutil.get_terminal_size().columns
+            except:
+                term_cols[0] = 80
 
         prefix_len = len('● ' + txt + '  ')
         hint_len = len(hint) + 2 if hint else 0
-        available_width = max(10, terminal_width - prefix_len - hint_len - 4)
-
+        available_width = max(10, term_cols[0] - prefix_len - hint_len - 4)
         filled = max(0, min(int(level * available_width), available_width))
-        bar = '█' * filled + '░' * (available_width - filled)
-        out.write(f'\r{RED}●{RST} {txt}  [{YEL}{bar}{RST}]{hint_str}')
     else:
-        # Simple mode - fixed width
+        available_width = 10
         filled = min(int(level * 200), 10)
-        bar = '=' * filled + ' ' * (10 - filled)
-        out.write(f'\r{RED}●{RST} {txt}  [{bar}]{hint_str}')
-
-    out.flush()
 
+    # Most ticks render the same frame; skip building and writing those
+    key = (filled, available_width, txt, hint, fullwidth)
+    if key == last_draw[0]:
+        return
+    last_draw[0] = key
 
-def record(start_proc, lang, mdl):
-    global rec, signal_stop
+    hint_str = f'  {MAG}{hint}{RST}' if hint else ''
+    if fullwidth:
+        bar = '█' * filled + '░' * (available_width - filled)
+        line = f'\r{RED}●{RST} {txt}  [{YEL}{bar}{RST}]{hint_str}'
+    else:
+        # Simple mode - fixed width
+        line = f'\r{RED}●{RST} {txt}  [{BARS[filled]}]{hint_str}'
+    if out_fd is not None:
+        os.write(out_fd, line.encode())
+    else:
+        out = sys.stderr if not is_tty else sys.stdout
+        out.write(line)
+        out.flush()
 
-    rec = []
-    q = queue.Queue()
 
-    # Only start keyboard listener if not in signal mode
-    if not signal_mode:
-        log('Starting keyboard listener thread')
-        threading.Thread(target=kbd_listen, args=(q,), daemon=True).start()
+def record(start_proc, lang, mdl):
+    """Record from the microphone and return mono float32 samples at SAMPLE_RATE"""
+    global rec_buf, vad_threshold_sq, vad_silence_frames
+    # PortAudio is only needed for the microphone, so file mode and --help skip it
+    import sounddevice as sd
+
+    # One up-front allocation; audio_cb copies each block in place
+    rec_buf = np.empty((SAMPLE_RATE * BUFFER_SECONDS, CHANNELS), dtype=DTYPE)
+    rec_frames[0] = 0
+    overflows[0] = 0
+    lvl[0] = 0.0
+    level_bucket[0] = -1
+    draw_event.clear()
+    stop_evt.clear()
 
     # Determine hint message based on mode
     hint = ''
@@ -261,81 +457,66 @@ def record(start_proc, lang, mdl):
     # Otherwise, use timeout when piped (not TTY)
     timeout = None if (signal_mode or vad_enabled) else (10 if not stdin_is_tty else None)
 
-    # VAD tracking variables
-    silence_start = None
-    has_speech = False
+    # VAD runs in audio_cb against the mean square, so square the threshold once
+    vad_threshold_sq = vad_threshold * vad_threshold
+    vad_silence_frames = int(vad_silence_duration * SAMPLE_RATE)
+    vad_speech[0] = False
+    vad_silent[0] = 0
 
     # Create stream without context manager for explicit control
-    stream = sd.InputStream(samplerate=SAMPLE_RATE, channels=CHANNELS, dtype=DTYPE, callback=audio_cb)
+    stream = sd.InputStream(samplerate=SAMPLE_RATE, channels=CHANNELS, dtype=DTYPE,
+                            blocksize=CHUNK_SIZE, latency=LATENCY, callback=audio_cb)
+
+    # Only start keyboard listener if not in signal mode. Started once the
+    # stream is open, so a failed open leaves no raw terminal or pipe behind
+    kbd = None
+    if not signal_mode:
+        log('Starting keyboard listener thread')
+        wake_r, wake_w = os.pipe()
+        kbd = threading.Thread(target=kbd_listen, args=(wake_r,), daemon=True)
+        kbd.start()
 
     try:
         stream.start()
         log('Audio stream started')
-        t0 = time.time()
-
-        while True:
-            draw(lvl[0], hint=hint, fullwidth=codevoice_mode)
-
-            # Update status with current audio level
-            write_status({
-                'status': 'recording',
-                'audio_level': float(lvl[0]),
-                'pid': os.getpid(),
-                'language': lang,
-                'model': mdl,
-                'timestamp': int(time.time()),
-                'progress': 0.0,
-                'duration': time.time() - t0,
-                'mode': mode,
-                'transcription': None
-            })
-
-            # Check signal stop (for signal mode)
-            if signal_mode and signal_stop[0]:
-                dur = time.time() - t0
-                log(f'Recording stopped by signal after {dur:.2f}s')
-                break
-
-            # VAD: Check for silence
-            if vad_enabled:
-                current_level = lvl[0]
-
-                # Detect if currently silent
-                is_silent = current_level < vad_threshold
-
-                if not is_silent:
-                    # Speech detected
-                    has_speech = True
-                    silence_start = None
-                    log(f'Speech detected (level: {current_level:.4f})')
-                elif has_speech:
-                    # Silence after speech
-                    if silence_start is None:
-                        silence_start = time.time()
-                        log(f'Silence started (level: {current_level:.4f})')
-                    else:
-                        silence_duration = time.time() - silence_start
-                        if silence_duration >= vad_silence_duration:
-                            dur = time.time() - t0
-                            log(f'Recording stopped after {silence_duration:.2f}s of silence (total: {dur:.2f}s)')
-                            break
+        # Monotonic for durations/timeouts so a clock step cannot end a recording
+        t0 = time.monotonic()
+        last_status = t0
+
+        # One futex wait per tick; SPACE/SIGUSR1 wake it immediately
+        while not stop_evt.wait(UI_TICK):
+            level = math.sqrt(lvl[0])
+            # Redraw only when audio_cb reports a meter change
+            if draw_event.is_set():
+                draw_event.clear()
+                draw(level, hint=hint, fullwidth=codevoice_mode)
+
+            now = time.monotonic()
+            # Update status with current audio level, at most every STATUS_INTERVAL
+            if status_file and now - last_status >= STATUS_INTERVAL:
+                last_status = now
+                write_status({
+                    'status': 'recording',
+                    'audio_level': level,
+                    'pid': os.getpid(),
+                    'language': lang,
+                    'model': mdl,
+                    'timestamp': int(now + EPOCH_OFFSET),
+                    'progress': 0.0,
+                    'duration': now - t0,
+                    'mode': mode,
+                    'transcription': None
+                })
 
             # Check timeout when piped
-            if timeout and (time.time() - t0) >= timeout:
+            if timeout and (now - t0) >= timeout:
                 log(f'Recording stopped after timeout ({timeout}s)')
+                stop_evt.set()
                 break
 
-            # Check keyboard input (only if not in signal mode)
-            if not signal_mode:
-                try:
-                    if q.get_nowait():
-                        dur = time.time() - t0
-                        log(f'Recording stopped after {dur:.2f}s')
-                        break
-                except queue.Empty:
-                    pass
-
-            time.sleep(0.01)  # Reduced from 0.05 for faster signal detection
+        log(f'Recording stopped after {time.monotonic() - t0:.2f}s')
+        if overflows[0] and not quiet_mode:
+            print(f'\nWarning: audio input overflowed {overflows[0]} times, some audio was dropped', file=sys.stderr)
     except Exception as e:
         log(f'Error during recording: {e}')
         print(f'\n{e}', file=sys.stderr)
@@ -351,29 +532,72 @@ def record(start_proc, lang, mdl):
         stream.stop()
         stream.close()
         log('Audio stream stopped and closed')
-
-    for _ in range(3):
-        draw(1.0, fullwidth=codevoice_mode)
-        time.sleep(0.15)
-        draw(0.0, fullwidth=codevoice_mode)
-        time.sleep(0.15)
-
+        if kbd is not None:
+            # Wake the keyboard listener so it restores the terminal before we print
+            os.write(wake_w, b'\0')
+            kbd.join(1.0)
+            os.close(wake_r)
+            os.close(wake_w)
+
+    # Hand off to the processing animation right away; its opening pulse
+    # replaces the old blocking 3x blink (0.9s before transcription began)
     start_proc()
 
-    if rec:
-        frames = len(rec)
-        log(f'Concatenating {frames} audio frames')
-        data = np.concatenate(rec)
-        if data.ndim > 1:
-            data = data.flatten()
-        return data
+    if rec_frames[0]:
+        log(f'Recorded {rec_frames[0]} audio frames')
+        data = rec_buf[:rec_frames[0]]
+        # Whisper wants mono; for mono the contiguous slice reshapes as a view
+        if CHANNELS == 1:
+            return data.reshape(-1)
+        return data.mean(axis=1, dtype=np.float32)
     else:
         log('No audio recorded')
         return None
 
 
-def transcribe(path, model, lang, run=None, blink_state=None):
-    global pct, preloaded_model
+class WhisperProgress:
+    """Stand-in for whisper's tqdm bar that turns decoded frames into UI/status updates"""
+
+    def __init__(self, lang, model, blink_state, total=None, **kwargs):
+        self.lang = lang
+        self.model = model
+        self.blink_state = blink_state
+        self.total = total or 1
+        self.n = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def update(self, n=1):
+        self.n += n
+        progress = min(self.n / self.total, 1.0)
+        if self.blink_state:
+            pct[0] = 0.2 + progress * 0.8
+        # Update status with progress
+        write_status({
+            'status': 'processing',
+            'audio_level': 0.0,
+            'pid': os.getpid(),
+            'language': self.lang,
+            'model': self.model,
+            'timestamp': int(time.time()),
+            'progress': progress,
+            'duration': 0.0,
+            'mode': 'processing',
+            'transcription': None
+        })
+
+
+def transcribe(audio, model, lang, run=None, blink_state=None):
+    """Transcribe a file path or a float32 array sampled at SAMPLE_RATE"""
+    global pct
+
+    # Wait for a background preload (see start_preload) rather than loading twice
+    if preload_thread is not None:
+        preload_thread.join()
 
     # Write processing status
     write_status({
@@ -390,21 +614,16 @@ def transcribe(path, model, lang, run=None, blink_state=None):
     })
 
     try:
+        # Load before choosing the path: in auto mode a faster-whisper that
+        # fails to import falls back to openai-whisper (and clears fast_mode)
+        m = load_model(model)
+
         # Use faster-whisper if fast_mode enabled and available
         if fast_mode and FASTER_WHISPER_AVAILABLE:
             log(f'Using faster-whisper with model: {model}')
 
-            # Use preloaded model if available, otherwise load now
-            if preloaded_model is not None:
-                m = preloaded_model
-                log('Using preloaded model')
-            else:
-                t0 = time.time()
-                m = WhisperModel(model, device="cpu", compute_type="int8")
-                log(f'Model loaded in {time.time()-t0:.2f}s')
-
             if blink_state:
-                while (blink_state[0] // 6) % 2 != 0:
+                while (blink_state[0] // BLINK_TICKS) % 2 != 0:
                     time.sleep(0.01)
                 pct[0] = 0.2
 
@@ -412,16 +631,29 @@ def transcribe(path, model, lang, run=None, blink_state=None):
             t0 = time.time()
 
             # faster-whisper returns (segments, info)
-            segments, info = m.transcribe(path, language=lang, beam_size=5)
+            if batch_size > 1 and isinstance(audio, str):
+                # Decode once up front: needed for the length check, reused below
+                from faster_whisper import decode_audio
+                audio = decode_audio(audio, sampling_rate=SAMPLE_RATE)
+            if batch_size > 1 and len(audio) > BATCH_MIN_SECONDS * SAMPLE_RATE:
+                # Chunks are packed into one forward pass; memory grows with batch_size
+                from faster_whisper import BatchedInferencePipeline
+                log(f'Batched inference (batch_size={batch_size})')
+                segments, info = BatchedInferencePipeline(model=m).transcribe(
+                    audio, language=lang, beam_size=5, batch_size=batch_size)
+            else:
+                segments, info = m.transcribe(audio, language=lang, beam_size=5)
 
-            # Collect segments into text
-            text = ""
+            # Segments are generated lazily; drive progress off the audio position
+            total = info.duration or 30.0
+            parts = []
             for segment in segments:
-                text += segment.text
+                parts.append(segment.text)
                 if blink_state:
-                    pct[0] = min(0.2 + (segment.end / 30.0) * 0.8, 1.0)
+                    pct[0] = min(0.2 + (segment.end / total) * 0.8, 1.0)
                 log(f'Segment: [{segment.start:.2f}s -> {segment.end:.2f}s] {segment.text}')
 
+            text = ''.join(parts)
             log(f'Transcription completed in {time.time()-t0:.2f}s')
             log(f'Detected language: {info.language}')
             log(f'Text length: {len(text)} chars')
@@ -435,56 +667,36 @@ def transcribe(path, model, lang, run=None, blink_state=None):
 
         else:
             # Use standard openai-whisper
-            log(f'Loading Whisper model: {model}')
-
-            # Use preloaded model if available
-            if preloaded_model is not None:
-                m = preloaded_model
-                log('Using preloaded model')
-            else:
-                t0 = time.time()
-                m = whisper.load_model(model)
-                log(f'Model loaded in {time.time()-t0:.2f}s')
+            log(f'Using openai-whisper with model: {model}')
 
             if blink_state:
-                while (blink_state[0] // 6) % 2 != 0:
+                while (blink_state[0] // BLINK_TICKS) % 2 != 0:
                     time.sleep(0.01)
                 pct[0] = 0.2
 
-            class P:
-                def write(self, txt):
-                    if verbose and txt.strip():
-                        print(f'[WHISPER] {txt.strip()}', file=sys.__stderr__)
-                    if '%' in txt and (x := re.search(r'(\d+)%', txt)):
-                        progress = int(x.group(1)) / 100.0
-                        if blink_state:
-                            pct[0] = 0.2 + progress * 0.8
-                        # Update status with progress
-                        write_status({
-                            'status': 'processing',
-                            'audio_level': 0.0,
-                            'pid': os.getpid(),
-                            'language': lang,
-                            'model': model,
-                            'timestamp': int(time.time()),
-                            'progress': progress,
-                            'duration': 0.0,
-                            'mode': 'processing',
-                            'transcription': None
-                        })
-                def flush(self): pass
-
-            old = sys.stderr
-            sys.stderr = P()
+            # whisper.transcribe drives a tqdm.tqdm bar; give it ours instead of
+            # parsing the bar off stderr. sys.modules because the package
+            # re-exports the transcribe() function under the submodule's name.
+            wt = sys.modules.get('whisper.transcribe')
+            old_tqdm = getattr(wt, 'tqdm', None)
+            if old_tqdm is not None:
+                import types
+                wt.tqdm = types.SimpleNamespace(
+                    tqdm=lambda **kw: WhisperProgress(lang, model, blink_state, **kw))
 
             log(f'Starting transcription (language={lang})')
             t0 = time.time()
-            r = m.transcribe(path, language=lang, fp16=False, verbose=False)
+            # FP16 only helps (and only works reliably) on CUDA
+            fp16 = getattr(m, 'device', None) is not None and m.device.type == 'cuda'
+            try:
+                r = m.transcribe(audio, language=lang, fp16=fp16, verbose=False)
+            finally:
+                if old_tqdm is not None:
+                    wt.tqdm = old_tqdm
             log(f'Transcription completed in {time.time()-t0:.2f}s')
             log(f'Detected language: {r.get("language", "unknown")}')
             log(f'Text length: {len(r["text"])} chars')
 
-            sys.stderr = old
             if blink_state:
                 pct[0] = 1.0
                 time.sleep(0.1)
@@ -504,78 +716,146 @@ def transcribe(path, model, lang, run=None, blink_state=None):
         time.sleep(0.05)
 
 
+def cuda_available(use_faster):
+    """Check for a usable CUDA device via the backend's own runtime"""
+    try:
+        if use_faster:
+            import ctranslate2
+            return ctranslate2.get_cuda_device_count() > 0
+        import torch
+        return torch.cuda.is_available()
+    except Exception:
+        return False
+
+
+def load_model(model_name):
+    """Return the model for the active backend, loading it at most once per process"""
+    global fast_mode
+    use_faster = fast_mode and FASTER_WHISPER_AVAILABLE
+    key = ('faster-whisper' if use_faster else 'whisper', model_name)
+    if key in model_cache:
+        log(f'Using cached model: {model_name}')
+        return model_cache[key]
+
+    # FP16 on GPU; on CPU faster-whisper runs int8, openai-whisper stays FP32
+    # "auto" is resolved here too, so the compute type below matches the device
+    if device_override in (None, 'auto'):
+        device = 'cuda' if cuda_available(use_faster) else 'cpu'
+    else:
+        device = device_override
+    t0 = time.time()
+    if use_faster:
+        compute_type = compute_type_override or ('float16' if device == 'cuda' else 'int8')
+        try:
+            from faster_whisper import WhisperModel
+        except ImportError as e:
+            # Installed but unusable (e.g. ctranslate2 cannot load its library)
+            if fast_mode_forced:
+                raise
+            log(f'faster-whisper failed to import ({e}), falling back to openai-whisper')
+            fast_mode = False
+            return load_model(model_name)
+        m = WhisperModel(model_name, device=device, compute_type=compute_type)
+        log(f'Using device={device}, compute_type={compute_type}')
+    else:
+        import whisper
+        m = whisper.load_model(model_name, device=device)
+        log(f'Using device={device}')
+    log(f'Model loaded in {time.time()-t0:.2f}s')
+    model_cache[key] = m
+    return m
+
+
 def preload_model(model_name, lang):
     """Preload Whisper model for faster transcription"""
-    global preloaded_model
+    log(f'Preloading {"faster-whisper" if fast_mode else "whisper"} model: {model_name}')
+    load_model(model_name)
 
-    if fast_mode and FASTER_WHISPER_AVAILABLE:
-        log(f'Preloading faster-whisper model: {model_name}')
-        t0 = time.time()
-        preloaded_model = WhisperModel(model_name, device="cpu", compute_type="int8")
-        log(f'Model preloaded in {time.time()-t0:.2f}s')
-    else:
-        log(f'Preloading whisper model: {model_name}')
-        t0 = time.time()
-        preloaded_model = whisper.load_model(model_name)
-        log(f'Model preloaded in {time.time()-t0:.2f}s')
+
+def start_preload(model_name, lang):
+    """Import whisper and load the model in a background thread"""
+    global preload_thread
+
+    def run():
+        try:
+            preload_model(model_name, lang)
+        except Exception as e:
+            # transcribe() will load (and report errors) on its own
+            log(f'Background preload failed: {e}')
+
+    preload_thread = threading.Thread(target=run, daemon=True)
+    preload_thread.start()
 
 
 def show_processing_animation(run, pct, blink_state, fullwidth):
-    """Show processing animation in background thread"""
+    """Show processing animation until stop_processing_animation(run)"""
     def prog():
-        while run[0]:
-            # Simple pulsing animation when starting (<15%)
-            if pct[0] < 0.15:
-                level = 0.1 if (blink_state[0] // 6) % 2 == 0 else 0.0
-            else:
-                level = pct[0]
-            blink_state[0] += 1
-            draw(level, txt='Processing', fullwidth=fullwidth)
-            time.sleep(0.05)
-    threading.Thread(target=prog, daemon=True).start()
+        # Simple pulsing animation when starting (<15%)
+        if pct[0] < 0.15:
+            level = 0.1 if (blink_state[0] // BLINK_TICKS) % 2 == 0 else 0.0
+        else:
+            level = pct[0]
+        blink_state[0] += 1
+        draw(level, txt='Processing', fullwidth=fullwidth)
+
     pct[0] = 0.0
+    if fast_mode and FASTER_WHISPER_AVAILABLE:
+        # CTranslate2 releases the GIL while decoding, so a thread keeps ticking;
+        # a signal handler would wait for the main thread to get back to bytecode
+        done = threading.Event()
 
+        def loop():
+            while run[0] and not done.wait(UI_TICK):
+                prog()
 
-def process_file(file_path, lang, mdl, codevoice):
-    """Transcribe audio from file"""
-    # Validate file exists
-    if not os.path.exists(file_path):
-        print(f'Error: File not found: {file_path}', file=sys.stderr)
-        sys.exit(1)
+        t = threading.Thread(target=loop, daemon=True)
+        t.start()
 
-    # Validate file is readable
-    if not os.path.isfile(file_path):
-        print(f'Error: Not a file: {file_path}', file=sys.stderr)
-        sys.exit(1)
+        def stop():
+            done.set()
+            t.join()
+    else:
+        # openai-whisper decodes from Python, so a SIGALRM timer ticks between
+        # its bytecodes without an extra thread competing for the GIL
+        import signal
 
-    # Check file size (warn if > 100MB)
-    file_size = os.path.getsize(file_path)
-    if file_size > 100 * 1024 * 1024:
-        print(f'Warning: Large file ({file_size / (1024*1024):.1f}MB), transcription may take a while', file=sys.stderr)
+        def tick(signum, frame):
+            if run[0]:
+                prog()
 
-    log(f'Processing file: {file_path} ({file_size} bytes)')
+        old_handler = signal.signal(signal.SIGALRM, tick)
+        signal.setitimer(signal.ITIMER_REAL, UI_TICK, UI_TICK)
 
-    # Preload model if fast_mode enabled
-    if fast_mode:
-        preload_model(mdl, lang)
+        def stop():
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, old_handler)
+    anim_stop[0] = stop
 
-    # Show processing UI
-    global pct
-    run = [True]
-    blink_state = [0]
-    show_processing_animation(run, pct, blink_state, codevoice)
 
+def stop_processing_animation(run):
+    """Stop the processing animation (if running) before the line is cleared"""
+    run[0] = False
+    stop, anim_stop[0] = anim_stop[0], None
+    if stop is not None:
+        stop()
+
+
+def transcribe_and_output(audio, lang, mdl, run, blink_state, source=None, append=False):
+    """Transcribe, clear the UI line, emit the text and write the final status"""
     try:
-        r = transcribe(file_path, mdl, lang, run, blink_state)
-        # Clear the UI line (unless in quiet/json mode)
+        r = transcribe(audio, mdl, lang, run, blink_state)
+        # Stop the animation first so a late tick cannot redraw over the result
+        stop_processing_animation(run)
+        # Clear the UI line on the appropriate stream (unless in quiet/json mode)
         if not quiet_mode and not json_mode:
             out = sys.stderr if not is_tty else sys.stdout
             out.write('\r' + CLR)
             out.flush()
+            last_draw[0] = None
         log(f'Final transcription: "{r["text"].strip()}"')
 
         text = r['text'].strip()
-        output_transcription(text, lang, mdl)
+        output_transcription(text, lang, mdl, source=source, append=append)
 
         # Write final status
         write_status({
@@ -595,17 +875,120 @@ def process_file(file_path, lang, mdl, codevoice):
         if verbose:
             import traceback
             traceback.print_exc()
+        elif source is not None:
+            print(f'Error: {source}: {e}', file=sys.stderr)
         else:
             print(f'Error: {e}', file=sys.stderr)
         sys.exit(1)
     finally:
-        run[0] = False
+        stop_processing_animation(run)
+
+
+def validate_input_file(file_path):
+    """Exit with an error unless file_path is an existing, non-empty regular file"""
+    # Validate file exists
+    if not os.path.exists(file_path):
+        print(f'Error: File not found: {file_path}', file=sys.stderr)
+        sys.exit(1)
+
+    # Validate file is readable
+    if not os.path.isfile(file_path):
+        print(f'Error: Not a file: {file_path}', file=sys.stderr)
+        sys.exit(1)
+
+    # Nothing to decode; fail before paying for the model load
+    if os.path.getsize(file_path) == 0:
+        print(f'Error: Empty file: {file_path}', file=sys.stderr)
+        sys.exit(1)
+
+
+def process_file(file_path, lang, mdl, codevoice, source=None, append=False):
+    """Transcribe audio from file (source/append: see output_transcription)"""
+    validate_input_file(file_path)
+
+    # Check file size (warn if > 100MB)
+    file_size = os.path.getsize(file_path)
+    if file_size > 100 * 1024 * 1024:
+        print(f'Warning: Large file ({file_size / (1024*1024):.1f}MB), transcription may take a while', file=sys.stderr)
+
+    log(f'Processing file: {file_path} ({file_size} bytes)')
+
+    # Start async readahead into the page cache while the model loads; the
+    # decoder opens its own fd, so a per-fd SEQUENTIAL hint would not reach it
+    if hasattr(os, 'posix_fadvise'):
+        try:
+            fd = os.open(file_path, os.O_RDONLY)
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            finally:
+                os.close(fd)
+        except OSError as e:
+            log(f'posix_fadvise failed: {e}')
+
+    # Preload model if fast_mode enabled
+    if fast_mode:
+        preload_model(mdl, lang)
+
+    # Show processing UI
+    global pct
+    run = [True]
+    blink_state = [0]
+    show_processing_animation(run, pct, blink_state, codevoice)
+
+    transcribe_and_output(file_path, lang, mdl, run, blink_state, source, append)
+
+
+def process_batch(paths, lang, mdl, codevoice):
+    """Transcribe each file in turn; return how many of them failed"""
+    failed = 0
+    written = 0
+    for path in paths:
+        # process_file exits on a bad input or a transcription error; it has
+        # already reported it, so note the failure and go on with the next file
+        try:
+            process_file(path, lang, mdl, codevoice, source=path, append=written > 0)
+        except SystemExit as e:
+            if e.code:
+                failed += 1
+                continue
+        written += 1
+    if failed:
+        print(f'Error: {failed} of {len(paths)} files failed', file=sys.stderr)
+    return failed
+
+
+def trim_silence(data):
+    """Cut leading/trailing audio below the VAD threshold, keeping 0.2s of margin"""
+    win = SAMPLE_RATE // 10  # 100ms energy frames
+    n = len(data) // win
+    if n == 0:
+        return data
+    frames = data[:n * win].reshape(n, win)
+    loud = np.flatnonzero(np.einsum('ij,ij->i', frames, frames) >= vad_threshold_sq * win)
+    # The partial frame at the end counts too: speech can run right up to the stop
+    tail = data[n * win:]
+    tail_loud = len(tail) > 0 and float(np.dot(tail, tail)) >= vad_threshold_sq * len(tail)
+    if len(loud) == 0 and not tail_loud:
+        # Nothing above the threshold; let Whisper decide
+        return data
+
+    pad = SAMPLE_RATE // 5
+    i0 = max(0, (loud[0] if len(loud) else n) * win - pad)
+    if tail_loud or loud[-1] == n - 1:
+        i1 = len(data)
+    else:
+        i1 = min(len(data), (loud[-1] + 1) * win + pad)
+    if i1 - i0 < SAMPLE_RATE * 0.3 or (i0 == 0 and i1 == len(data)):
+        return data
+    log(f'Trimmed silence: {i0/SAMPLE_RATE:.2f}s leading, {(len(data)-i1)/SAMPLE_RATE:.2f}s trailing')
+    return data[i0:i1]
 
 
 def process_recording(lang, mdl, sig_mode, codevoice):
     """Record and transcribe audio from microphone"""
     # Configure signal handler if in signal mode
     if sig_mode:
+        import signal
         signal.signal(signal.SIGUSR1, signal_handler)
         log('Signal mode enabled: listening for SIGUSR1')
         # Show PID in stderr even in quiet/json mode (needed for signal)
@@ -615,9 +998,8 @@ def process_recording(lang, mdl, sig_mode, codevoice):
 
     log(f'Starting listen (language={lang}, model={mdl})')
 
-    # Preload model if fast_mode enabled
-    if fast_mode:
-        preload_model(mdl, lang)
+    # Load the model while the user is speaking instead of after
+    start_preload(mdl, lang)
 
     global pct
     run = [True]
@@ -629,80 +1011,40 @@ def process_recording(lang, mdl, sig_mode, codevoice):
     data = record(start_proc, lang, mdl)
     if data is None or len(data) == 0:
         log('No audio data to process')
+        stop_processing_animation(run)
         sys.exit(1)
 
     log(f'Audio data shape: {data.shape}, duration: {len(data)/SAMPLE_RATE:.2f}s')
 
-    tmp = tempfile.NamedTemporaryFile(suffix='.wav', delete=False)
-    log(f'Saving audio to temp file: {tmp.name}')
-    with wave.open(tmp.name, 'wb') as w:
-        w.setnchannels(CHANNELS)
-        w.setsampwidth(2)
-        w.setframerate(SAMPLE_RATE)
-        w.writeframes((data * 32767).astype(np.int16).tobytes())
-    log(f'Audio file size: {os.path.getsize(tmp.name)} bytes')
-
-    try:
-        r = transcribe(tmp.name, mdl, lang, run, blink_state)
-        # Clear the UI line on the appropriate stream (unless in quiet/json mode)
-        if not quiet_mode and not json_mode:
-            out = sys.stderr if not is_tty else sys.stdout
-            out.write('\r' + CLR)
-            out.flush()
-        log(f'Final transcription: "{r["text"].strip()}"')
-
-        text = r['text'].strip()
-        output_transcription(text, lang, mdl)
-
-        # Write final status
-        write_status({
-            'status': 'done',
-            'audio_level': 0.0,
-            'pid': os.getpid(),
-            'language': lang,
-            'model': mdl,
-            'timestamp': int(time.time()),
-            'progress': 1.0,
-            'duration': 0.0,
-            'mode': 'done',
-            'transcription': text
-        })
-    except Exception as e:
-        log(f'Transcription error: {e}')
-        if verbose:
-            import traceback
-            traceback.print_exc()
-        else:
-            print(f'Error: {e}', file=sys.stderr)
-        sys.exit(1)
-    finally:
-        run[0] = False
-        try:
-            os.unlink(tmp.name)
-            log(f'Deleted temp file: {tmp.name}')
-        except:
-            pass
+    # Fewer samples means fewer 30s windows for Whisper to decode. Only with
+    # --vad, whose threshold the user chose; SPACE/signal recordings stay whole
+    if vad_enabled:
+        data = trim_silence(data)
 
+    # Both backends take a 16 kHz float32 array, so no WAV round-trip
+    transcribe_and_output(data, lang, mdl, run, blink_state)
 
-def main():
-    global verbose, signal_mode, vad_enabled, vad_silence_duration, codevoice_mode
 
-    # Handle version
-    if len(sys.argv) > 1 and sys.argv[1] == '--version':
-        print(f"listen {__version__}")
-        return
+def batched_pipeline_available():
+    """True if the installed faster-whisper ships BatchedInferencePipeline (1.1+)"""
+    # Read the installed version instead of importing ctranslate2 up front
+    from importlib import metadata
+    try:
+        major, minor = metadata.version('faster-whisper').split('.')[:2]
+        return (int(major), int(minor)) >= (1, 1)
+    except (metadata.PackageNotFoundError, ValueError):
+        return False
 
-    # Handle help
-    if len(sys.argv) > 1 and sys.argv[1] in ['-h', '--help']:
-        print(HELP.format(lang=config.LANGUAGE, model=config.MODEL))
-        return
 
-    # Parse CLI arguments with argparse
-    global quiet_mode, json_mode, output_file, status_file, fast_mode
+def build_parser():
+    """Return the CLI argument parser (help text lives in HELP)"""
+    # Imported here so --help/--version skip it
+    import argparse
     parser = argparse.ArgumentParser(add_help=False)
     parser.add_argument('-l', '--language', default=config.LANGUAGE)
     parser.add_argument('-m', '--model', default=config.MODEL)
     parser.add_argument('-f', '--file', dest='file_path')
+    parser.add_argument('--batch', nargs='+', metavar='FILE')
     parser.add_argument('-q', '--quiet', action='store_true')
     parser.add_argument('-j', '--json', action='store_true', dest='json_output')
     parser.add_argument('-o', '--output')
@@ -712,8 +1054,21 @@ def main():
     parser.add_argument('--vad', type=float, metavar='SECONDS')
     parser.add_argument('--codevoice', action='store_true')
     parser.add_argument('--fast-mode', action='store_true')
+    parser.add_argument('--batch-size', type=int, default=1, metavar='N')
+    parser.add_argument('--device')
+    parser.add_argument('--compute-type')
+    return parser
 
-    args = parser.parse_args()
+
+def main():
+    global verbose, signal_mode, vad_enabled, vad_silence_duration, codevoice_mode
+    global quiet_mode, json_mode, output_file, status_file, status_tmp, fast_mode, batch_size
+    global device_override, compute_type_override, fast_mode_forced
+
+    if print_help_or_version(sys.argv[1:]):
+        return
+
+    args = build_parser().parse_args()
 
     # Apply parsed arguments
     lang = args.language
@@ -723,20 +1078,49 @@ def main():
     json_mode = args.json_output
     output_file = args.output
     status_file = args.status_file
+    status_tmp = f"{status_file}.tmp" if status_file else None
+    if status_file:
+        start_status_writer()
     verbose = args.verbose if args.verbose else config.SHOW_VERBOSE
     signal_mode = args.signal_mode
     vad_enabled = args.vad is not None
     vad_silence_duration = args.vad if args.vad else config.VAD_DEFAULT_DURATION
     codevoice_mode = args.codevoice
-    fast_mode = args.fast_mode
-
-    # Check if fast_mode is enabled but faster-whisper is not available
-    if fast_mode and not FASTER_WHISPER_AVAILABLE:
-        print('Error: --fast-mode requires faster-whisper. Install with: pip install faster-whisper', file=sys.stderr)
+    if codevoice_mode:
+        import signal
+        signal.signal(signal.SIGWINCH, winch_handler)
+    # BACKEND = "auto" picks faster-whisper whenever it is installed
+    backend_forced = args.fast_mode or config.BACKEND == 'faster-whisper'
+    fast_mode = backend_forced or (config.BACKEND == 'auto' and FASTER_WHISPER_AVAILABLE)
+    fast_mode_forced = backend_forced
+    batch_size = max(1, args.batch_size)
+    device_override = args.device
+    compute_type_override = args.compute_type
+
+    # Check if faster-whisper was explicitly requested but is not available
+    if backend_forced and not FASTER_WHISPER_AVAILABLE:
+        print('Error: --fast-mode (or BACKEND = "faster-whisper") requires faster-whisper. Install with: pip install faster-whisper', file=sys.stderr)
+        sys.exit(1)
+    if compute_type_override and not fast_mode:
+        print('Warning: --compute-type only applies to faster-whisper, ignoring', file=sys.stderr)
+        compute_type_override = None
+    if batch_size > 1 and not fast_mode:
+        print('Warning: --batch-size only applies to faster-whisper, ignoring', file=sys.stderr)
+        batch_size = 1
+    elif batch_size > 1 and not batched_pipeline_available():
+        print('Warning: --batch-size needs faster-whisper>=1.1 (BatchedInferencePipeline), ignoring', file=sys.stderr)
+        batch_size = 1
+
+    if args.batch and file_path:
+        print('Error: -f/--file and --batch cannot be combined; list every file after --batch', file=sys.stderr)
         sys.exit(1)
 
     # Route to appropriate mode
-    if file_path:
+    if args.batch:
+        # Same process for every file, so load_model() hits model_cache after the first
+        if process_batch(args.batch, lang, mdl, codevoice_mode):
+            sys.exit(1)
+    elif file_path:
         process_file(file_path, lang, mdl, codevoice_mode)
     else:
         process_recording(lang, mdl, signal_mode, codevoice_mode)
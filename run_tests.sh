@@ -18,7 +18,7 @@ fi
 # Check if pytest is installed
 if ! command -v pytest &> /dev/null; then
     echo "pytest not found. Installing..."
-    pip install pytest pytest-cov
+    pip install pytest pytest-cov pytest-xdist
 fi
 
 # Parse arguments
@@ -36,6 +36,10 @@ case "${1:-all}" in
         pytest --cov=. --cov-report=term --cov-report=html
         echo -e "\n${GREEN}Coverage report generated in htmlcov/index.html${NC}"
         ;;
+    "parallel")
+        echo -e "${GREEN}Running all tests in parallel...${NC}"
+        pytest -n auto
+        ;;
     "quick")
         echo -e "${GREEN}Running quick tests (no output)...${NC}"
         pytest -q
@@ -4,38 +4,56 @@ Tests for listen.py main functionality
 """
 
 import pytest
-import tempfile
 import os
-import sys
+import json
+import math
+import re
+import signal
 import subprocess
+import sys
+import threading
+import time
+import types
+
+import numpy as np
+
+# Never created: tests that use it only need the argument, or a missing file
+FAKE_WAV = '/tmp/fake.wav'
+VERSION_RE = re.compile(r'\d+\.\d+\.\d+')
 
 
 class TestCLIHelp:
     """Test CLI help and usage information"""
 
-    def test_help_flag(self):
+    def test_help_flag(self, help_output):
         """Test that --help flag works"""
-        result = subprocess.run(
-            [sys.executable, 'listen.py', '--help'],
-            capture_output=True,
-            text=True,
-            cwd=os.path.dirname(os.path.abspath(__file__))
-        )
+        result = help_output
 
         assert result.returncode == 0
         assert 'usage:' in result.stdout.lower()
-        assert '--file' in result.stdout
-        assert '--language' in result.stdout
-        assert '--model' in result.stdout
 
-    def test_help_shows_file_mode(self):
+    def test_help_fast_path(self, run_listen, help_output):
+        """Test that --help exits before the heavy imports, with the same text"""
+        # No site-packages: only config.py (next to listen.py) may be imported
+        result = run_listen(['--help'], python_flags=('-S', '-X', 'importtime'))
+
+        assert result.returncode == 0
+        assert result.stdout == help_output.stdout
+        assert 'numpy' not in result.stderr
+
+    @pytest.mark.parametrize('text', [
+        '--file', '-f', '--language', '--model',
+        '--codevoice', '--vad', '--signal-mode', '--fast-mode',
+        '--batch', '--batch-size', '--device', '--compute-type',
+        'config.py', 'reinstall',
+    ])
+    def test_help_contains(self, help_output, text):
+        """Test that help lists every flag and the config.py hint"""
+        assert text.lower() in help_output.stdout.lower()
+
+    def test_help_shows_file_mode(self, help_output_short):
         """Test that help shows file processing mode"""
-        result = subprocess.run(
-            [sys.executable, 'listen.py', '-h'],
-            capture_output=True,
-            text=True,
-            cwd=os.path.dirname(os.path.abspath(__file__))
-        )
+        result = help_output_short
 
         assert result.returncode == 0
         assert '-f' in result.stdout or '--file' in result.stdout
@@ -45,53 +63,32 @@ class TestCLIHelp:
 class TestFileMode:
     """Test file processing mode"""
 
-    def test_file_not_found(self):
+    def test_file_not_found(self, capsys):
         """Test error handling when file doesn't exist"""
-        result = subprocess.run(
-            [sys.executable, 'listen.py', '-f', '/nonexistent/file.mp3'],
-            capture_output=True,
-            text=True,
-            cwd=os.path.dirname(os.path.abspath(__file__))
-        )
+        import listen
+        with pytest.raises(SystemExit) as exc:
+            listen.validate_input_file('/nonexistent/file.mp3')
 
-        assert result.returncode == 1
-        assert 'File not found' in result.stderr or 'not found' in result.stderr.lower()
+        assert exc.value.code == 1
+        assert 'not found' in capsys.readouterr().err.lower()
 
-    def test_file_is_directory(self):
+    def test_file_is_directory(self, capsys, tmp_path):
         """Test error handling when path is a directory"""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            result = subprocess.run(
-                [sys.executable, 'listen.py', '-f', tmpdir],
-                capture_output=True,
-                text=True,
-                cwd=os.path.dirname(os.path.abspath(__file__))
-            )
-
-            assert result.returncode == 1
-            assert 'Not a file' in result.stderr or 'not a file' in result.stderr.lower()
-
-    def test_file_argument_parsing(self):
+        import listen
+        with pytest.raises(SystemExit) as exc:
+            listen.validate_input_file(str(tmp_path))
+
+        assert exc.value.code == 1
+        assert 'not a file' in capsys.readouterr().err.lower()
+
+    def test_file_argument_parsing(self, run_listen, empty_wav):
         """Test that -f and --file arguments are recognized"""
-        # Test with empty file to avoid transcription
-        with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as tmp:
-            tmp_path = tmp.name
-
-        try:
-            # This will fail during transcription but should parse the argument
-            result = subprocess.run(
-                [sys.executable, 'listen.py', '-f', tmp_path, '-v'],
-                capture_output=True,
-                text=True,
-                timeout=5,
-                cwd=os.path.dirname(os.path.abspath(__file__))
-            )
-
-            # Check that it attempted to process the file (may fail on transcription)
-            # The important part is that it didn't fail on argument parsing
-            assert 'File not found' not in result.stderr
-        finally:
-            if os.path.exists(tmp_path):
-                os.unlink(tmp_path)
+        # The empty file is rejected, but only after the argument was parsed
+        result = run_listen(['-f', empty_wav, '-v'],
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+
+        # The important part is that it didn't fail on argument parsing
+        assert 'File not found' not in result.stderr
 
 
 class TestConfig:
@@ -122,353 +119,490 @@ class TestConfig:
         assert isinstance(config.VAD_THRESHOLD, float)
         assert isinstance(config.VAD_DEFAULT_DURATION, float)
 
-    def test_help_mentions_config_file(self):
-        """Test that help text mentions editing config.py"""
-        result = subprocess.run(
-            [sys.executable, 'listen.py', '--help'],
-            capture_output=True,
-            text=True,
-            cwd=os.path.dirname(os.path.abspath(__file__))
-        )
-
-        assert result.returncode == 0
-        assert 'config.py' in result.stdout.lower()
-        assert 'reinstall' in result.stdout.lower()
-
 
 class TestArgumentParsing:
     """Test CLI argument parsing"""
 
-    def test_language_argument(self):
-        """Test that language argument is accepted"""
-        # We're just testing parsing, not full execution
-        # Using a nonexistent file will fail fast after parsing
-        result = subprocess.run(
-            [sys.executable, 'listen.py', '-f', '/tmp/fake.wav', '-l', 'es'],
-            capture_output=True,
-            text=True,
-            timeout=2,
-            cwd=os.path.dirname(os.path.abspath(__file__))
-        )
-
-        # It should fail on file not found, not on argument parsing
-        assert 'File not found' in result.stderr or 'not found' in result.stderr.lower()
-
-    def test_model_argument(self):
-        """Test that model argument is accepted"""
-        result = subprocess.run(
-            [sys.executable, 'listen.py', '-f', '/tmp/fake.wav', '-m', 'tiny'],
-            capture_output=True,
-            text=True,
-            timeout=2,
-            cwd=os.path.dirname(os.path.abspath(__file__))
-        )
-
-        # It should fail on file not found, not on argument parsing
-        assert 'File not found' in result.stderr or 'not found' in result.stderr.lower()
-
-    def test_verbose_argument(self):
-        """Test that verbose argument is accepted"""
-        result = subprocess.run(
-            [sys.executable, 'listen.py', '-f', '/tmp/fake.wav', '-v'],
-            capture_output=True,
-            text=True,
-            timeout=2,
-            cwd=os.path.dirname(os.path.abspath(__file__))
-        )
-
-        # It should fail on file not found, not on argument parsing
-        assert 'File not found' in result.stderr or 'not found' in result.stderr.lower()
+    @pytest.mark.parametrize('argv, dest, value', [
+        (['-f', FAKE_WAV], 'file_path', FAKE_WAV),
+        (['-f', FAKE_WAV, '-l', 'es'], 'language', 'es'),
+        (['-f', FAKE_WAV, '-m', 'tiny'], 'model', 'tiny'),
+        (['-f', FAKE_WAV, '-v'], 'verbose', True),
+        (['-f', FAKE_WAV, '-j'], 'json_output', True),
+        (['-f', FAKE_WAV, '-q'], 'quiet', True),
+        (['-f', FAKE_WAV, '-o', '/tmp/out.txt'], 'output', '/tmp/out.txt'),
+        (['-f', FAKE_WAV, '--fast-mode', '--status-file', '/tmp/status.json'], 'fast_mode', True),
+        (['-f', FAKE_WAV, '--fast-mode', '--status-file', '/tmp/status.json'], 'status_file', '/tmp/status.json'),
+    ])
+    def test_parser_accepts(self, listen_module, argv, dest, value):
+        """Test that the parser accepts each option and stores its value"""
+        args = listen_module.build_parser().parse_args(argv)
+
+        assert getattr(args, dest) == value
 
 
 class TestValidation:
     """Test input validation"""
 
-    def test_empty_file_path(self):
+    def test_empty_file_path(self, run_listen, empty_wav):
         """Test handling of empty file path"""
-        # Create an empty file to test size validation
-        with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as tmp:
-            tmp_path = tmp.name
-
-        try:
-            # Empty audio file should exist but may fail during processing
-            assert os.path.exists(tmp_path)
-            assert os.path.getsize(tmp_path) == 0
-
-            # The validation should catch this during transcription
-            result = subprocess.run(
-                [sys.executable, 'listen.py', '-f', tmp_path],
-                capture_output=True,
-                text=True,
-                timeout=10,
-                cwd=os.path.dirname(os.path.abspath(__file__))
-            )
-
-            # Should handle empty file gracefully (may error during transcription)
-            assert result.returncode != 0 or 'Processing file:' in result.stderr
-        finally:
-            if os.path.exists(tmp_path):
-                os.unlink(tmp_path)
+        # Empty audio file should exist but may fail during processing
+        assert os.path.exists(empty_wav)
+        assert os.path.getsize(empty_wav) == 0
+
+        # Rejected by input validation, before any model is loaded
+        result = run_listen(['-f', empty_wav], timeout=3,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+
+        assert result.returncode == 1
+        assert 'empty file' in result.stderr.lower()
 
 
 class TestVersionFlag:
     """Test version flag"""
 
-    def test_version_flag(self):
+    def test_version_flag(self, version_output):
         """Test that --version shows version number"""
-        result = subprocess.run(
-            [sys.executable, 'listen.py', '--version'],
-            capture_output=True,
-            text=True,
-            cwd=os.path.dirname(os.path.abspath(__file__))
-        )
+        result = version_output
 
         assert result.returncode == 0
         assert 'listen' in result.stdout
         # Should contain version number (format: X.Y.Z)
-        import re
-        assert re.search(r'\d+\.\d+\.\d+', result.stdout)
-
-
-class TestOutputModes:
-    """Test various output modes"""
-
-    def test_json_flag_recognized(self):
-        """Test that -j/--json flag is recognized"""
-        # Test with nonexistent file to fail fast
-        result = subprocess.run(
-            [sys.executable, 'listen.py', '-f', '/tmp/fake.wav', '-j'],
-            capture_output=True,
-            text=True,
-            timeout=2,
-            cwd=os.path.dirname(os.path.abspath(__file__))
-        )
-
-        # Should fail on file not found, not on argument parsing
-        assert 'File not found' in result.stderr or 'not found' in result.stderr.lower()
-
-    def test_quiet_flag_recognized(self):
-        """Test that -q/--quiet flag is recognized"""
-        result = subprocess.run(
-            [sys.executable, 'listen.py', '-f', '/tmp/fake.wav', '-q'],
-            capture_output=True,
-            text=True,
-            timeout=2,
-            cwd=os.path.dirname(os.path.abspath(__file__))
-        )
-
-        # Should fail on file not found, not on argument parsing
-        assert 'File not found' in result.stderr or 'not found' in result.stderr.lower()
-
-    def test_output_file_flag_recognized(self):
-        """Test that -o/--output flag is recognized"""
-        result = subprocess.run(
-            [sys.executable, 'listen.py', '-f', '/tmp/fake.wav', '-o', '/tmp/out.txt'],
-            capture_output=True,
-            text=True,
-            timeout=2,
-            cwd=os.path.dirname(os.path.abspath(__file__))
-        )
-
-        # Should fail on file not found, not on argument parsing
-        assert 'File not found' in result.stderr or 'not found' in result.stderr.lower()
-
-
-class TestSpecialModes:
-    """Test special recording modes"""
-
-    def test_codevoice_flag_recognized(self):
-        """Test that --codevoice flag is recognized"""
-        result = subprocess.run(
-            [sys.executable, 'listen.py', '--help'],
-            capture_output=True,
-            text=True,
-            cwd=os.path.dirname(os.path.abspath(__file__))
-        )
+        assert VERSION_RE.search(result.stdout)
 
-        assert result.returncode == 0
-        assert '--codevoice' in result.stdout
-
-    def test_vad_flag_recognized(self):
-        """Test that --vad flag is recognized in help"""
-        result = subprocess.run(
-            [sys.executable, 'listen.py', '--help'],
-            capture_output=True,
-            text=True,
-            cwd=os.path.dirname(os.path.abspath(__file__))
-        )
-
-        assert result.returncode == 0
-        assert '--vad' in result.stdout
-
-    def test_signal_mode_flag_recognized(self):
-        """Test that --signal-mode flag is recognized in help"""
-        result = subprocess.run(
-            [sys.executable, 'listen.py', '--help'],
-            capture_output=True,
-            text=True,
-            cwd=os.path.dirname(os.path.abspath(__file__))
-        )
+    def test_version_fast_path(self, run_listen):
+        """Test that --version exits before the heavy imports"""
+        # Isolated, no site: the fast path must not need anything beyond sys
+        result = run_listen(['--version'], python_flags=('-I', '-S', '-X', 'importtime'))
 
         assert result.returncode == 0
-        assert '--signal-mode' in result.stdout
-
-    def test_fast_mode_flag_recognized(self):
-        """Test that --fast-mode flag is recognized in help"""
-        result = subprocess.run(
-            [sys.executable, 'listen.py', '--help'],
-            capture_output=True,
-            text=True,
-            cwd=os.path.dirname(os.path.abspath(__file__))
-        )
-
-        assert result.returncode == 0
-        assert '--fast-mode' in result.stdout
+        assert result.stdout.startswith('listen ')
+        # -X importtime lists every module imported, on stderr
+        assert 'numpy' not in result.stderr
 
 
 class TestFastMode:
     """Test fast mode functionality"""
 
-    def test_fast_mode_requires_faster_whisper(self):
+    def test_fast_mode_requires_faster_whisper(self, listen_module, listen_cli, monkeypatch):
         """Test that --fast-mode validates faster-whisper availability"""
-        import listen
-
-        # Save original value
-        original_available = listen.FASTER_WHISPER_AVAILABLE
-
         # Test when faster-whisper is not available
-        listen.FASTER_WHISPER_AVAILABLE = False
-
-        result = subprocess.run(
-            [sys.executable, 'listen.py', '-f', '/tmp/fake.wav', '--fast-mode'],
-            capture_output=True,
-            text=True,
-            timeout=2,
-            cwd=os.path.dirname(os.path.abspath(__file__))
-        )
+        monkeypatch.setattr(listen_module, 'FASTER_WHISPER_AVAILABLE', False)
 
-        # Restore original value
-        listen.FASTER_WHISPER_AVAILABLE = original_available
+        result = listen_cli.run(['-f', FAKE_WAV, '--fast-mode'])
 
         # Should fail with error about faster-whisper not installed
-        # Note: This test may pass if faster-whisper IS installed, which is fine
-        if not original_available:
-            assert result.returncode != 0
-            assert 'faster-whisper' in result.stderr.lower() or 'Error' in result.stderr
-
-    def test_fast_mode_with_status_file(self):
-        """Test that --fast-mode works with --status-file"""
-        import tempfile
-
-        tmp_status = tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False)
-        tmp_status.close()
-
-        try:
-            result = subprocess.run(
-                [sys.executable, 'listen.py', '-f', '/tmp/fake.wav', '--fast-mode', '--status-file', tmp_status.name],
-                capture_output=True,
-                text=True,
-                timeout=2,
-                cwd=os.path.dirname(os.path.abspath(__file__))
-            )
-
-            # Should fail on file not found, not on argument combination
-            assert 'File not found' in result.stderr or 'not found' in result.stderr.lower()
-        finally:
-            if os.path.exists(tmp_status.name):
-                os.unlink(tmp_status.name)
+        assert result.returncode != 0
+        assert 'faster-whisper' in result.stderr.lower()
+
+    @pytest.fixture
+    def broken_faster_whisper(self, listen_module, monkeypatch, tmp_path):
+        """faster_whisper that is installed but raises on import; whisper is a fake"""
+        (tmp_path / 'faster_whisper.py').write_text(
+            "raise ImportError('libctranslate2.so.4: cannot open shared object file')\n")
+        monkeypatch.syspath_prepend(str(tmp_path))
+        monkeypatch.delitem(sys.modules, 'faster_whisper', raising=False)
+
+        class Model:
+            def transcribe(self, audio, **kw):
+                return {'text': ' from whisper ', 'language': 'en'}
+
+        monkeypatch.setitem(sys.modules, 'whisper',
+                            types.SimpleNamespace(load_model=lambda name, device=None: Model()))
+        monkeypatch.setattr(listen_module, 'FASTER_WHISPER_AVAILABLE', True)
+        monkeypatch.setattr(listen_module, 'model_cache', {})
+        monkeypatch.setattr(listen_module, 'cuda_available', lambda use_faster: False)
+        wav = tmp_path / 'a.wav'
+        wav.write_bytes(b'RIFF')
+        return str(wav)
+
+    def test_auto_backend_falls_back_to_whisper(self, listen_module, listen_cli,
+                                                 monkeypatch, broken_faster_whisper):
+        """Test that BACKEND = "auto" still transcribes when faster-whisper cannot import"""
+        monkeypatch.setattr(listen_module.config, 'BACKEND', 'auto')
+
+        result = listen_cli.run(['-f', broken_faster_whisper, '-q'])
+
+        assert result.returncode == 0
+        assert result.stdout.strip() == 'from whisper'
+
+    def test_forced_backend_does_not_fall_back(self, listen_cli, broken_faster_whisper):
+        """Test that --fast-mode reports a broken faster-whisper instead of switching"""
+        # Escapes main(); the __main__ guard turns it into "Error: ..." and rc 1
+        with pytest.raises(ImportError, match='libctranslate2'):
+            listen_cli.run(['-f', broken_faster_whisper, '-q', '--fast-mode'])
+
+    @pytest.mark.parametrize('device,cuda,expected', [
+        ('auto', True, ('cuda', 'float16')),
+        ('auto', False, ('cpu', 'int8')),
+        (None, True, ('cuda', 'float16')),
+        ('cpu', True, ('cpu', 'int8')),
+    ])
+    def test_compute_type_follows_device(self, listen_mode, monkeypatch, device, cuda, expected):
+        """Test that the default compute type is chosen for the device actually used"""
+        loaded = []
+
+        class WhisperModel:
+            def __init__(self, name, device, compute_type):
+                loaded.append((device, compute_type))
+
+        monkeypatch.setitem(sys.modules, 'faster_whisper',
+                            types.SimpleNamespace(WhisperModel=WhisperModel))
+        listen = listen_mode(fast_mode=True, FASTER_WHISPER_AVAILABLE=True, model_cache={},
+                             device_override=device, compute_type_override=None,
+                             cuda_available=lambda use_faster: cuda)
+
+        listen.load_model('tiny')
+
+        assert loaded == [expected]
+
+    @pytest.mark.parametrize('flag', [['--compute-type', 'int8'], ['--batch-size', '4']])
+    def test_faster_whisper_flags_warn_on_whisper(self, listen_module, listen_cli, monkeypatch, flag):
+        """Test that faster-whisper-only flags warn when openai-whisper is the backend"""
+        monkeypatch.setattr(listen_module, 'FASTER_WHISPER_AVAILABLE', False)
+
+        # The missing file stops the run right after option handling
+        result = listen_cli.run(['-f', FAKE_WAV, *flag])
+
+        assert f'Warning: {flag[0]} only applies to faster-whisper' in result.stderr
+
+    @pytest.mark.parametrize('version,expected', [
+        ('1.0.3', False),
+        ('1.1.0', True),
+        ('1.2.1', True),
+        (None, False),
+    ])
+    def test_batched_pipeline_version(self, listen_module, monkeypatch, version, expected):
+        """Test that --batch-size is only honoured on faster-whisper 1.1+"""
+        from importlib import metadata
+
+        def fake_version(name):
+            if version is None:
+                raise metadata.PackageNotFoundError(name)
+            return version
+
+        monkeypatch.setattr(metadata, 'version', fake_version)
+        assert listen_module.batched_pipeline_available() is expected
 
 
 class TestOutputTranscription:
     """Test critical output functionality"""
 
-    def test_json_output_format(self):
+    def test_json_output_format(self, listen_mode, capsys):
         """Test that JSON output is properly formatted"""
-        import json
-        import listen
+        listen = listen_mode(json_mode=True, quiet_mode=False, output_file=None)
 
-        # Temporarily set modes
-        original_json = listen.json_mode
-        original_quiet = listen.quiet_mode
-        original_output = listen.output_file
-
-        try:
-            listen.json_mode = True
-            listen.quiet_mode = False
-            listen.output_file = None
-
-            # Capture stdout
-            from io import StringIO
-            import sys
-            captured = StringIO()
-            sys.stdout = captured
-
-            # Call output_transcription
-            listen.output_transcription("test text", "en", "tiny", 1.5)
-
-            # Get output
-            sys.stdout = sys.__stdout__
-            output = captured.getvalue()
-
-            # Validate JSON
-            data = json.loads(output.strip())
-            assert data['transcription'] == 'test text'
-            assert data['language'] == 'en'
-            assert data['model'] == 'tiny'
-            assert data['duration'] == 1.5
-
-        finally:
-            # Restore
-            listen.json_mode = original_json
-            listen.quiet_mode = original_quiet
-            listen.output_file = original_output
-
-    def test_file_output(self):
+        listen.output_transcription("test text", "en", "tiny", 1.5)
+
+        # Validate JSON
+        data = json.loads(capsys.readouterr().out.strip())
+        assert data['transcription'] == 'test text'
+        assert data['language'] == 'en'
+        assert data['model'] == 'tiny'
+        assert data['duration'] == 1.5
+
+    def test_file_output(self, listen_mode, capsys, tmp_path):
         """Test that file output writes correctly"""
-        import listen
+        out_path = tmp_path / 'out.txt'
+        listen = listen_mode(json_mode=False, quiet_mode=True, output_file=str(out_path))
+
+        listen.output_transcription("test output", "es", "tiny")
+
+        # Should still print to stdout
+        assert 'test output' in capsys.readouterr().out
+
+        # Verify file was written
+        assert out_path.read_text() == 'test output'
+
+
+class TestRecord:
+    """Test record() setup and teardown around the input stream"""
+
+    def test_stream_open_failure_leaves_no_listener(self, listen_mode, monkeypatch):
+        """Test that a failed stream open starts no keyboard thread and leaks no pipe"""
+        def no_device(**kw):
+            raise RuntimeError('Error querying device -1')
+
+        monkeypatch.setitem(sys.modules, 'sounddevice', types.SimpleNamespace(InputStream=no_device))
+        started = []
+        listen = listen_mode(signal_mode=False, vad_enabled=False, quiet_mode=True,
+                             kbd_listen=lambda wake_fd: started.append(wake_fd),
+                             draw=lambda *a, **kw: None)
+        # Open fds, where the platform lists them (Linux, Termux)
+        fd_dir = '/proc/self/fd'
+        fds = len(os.listdir(fd_dir)) if os.path.isdir(fd_dir) else None
+
+        with pytest.raises(RuntimeError, match='querying device'):
+            listen.record(lambda: None, 'en', 'tiny')
+
+        assert started == []
+        if fds is not None:
+            assert len(os.listdir(fd_dir)) == fds
+
+
+class TestAudioCallback:
+    """Test the sounddevice input callback, driven with synthetic blocks"""
+
+    BLOCK = 256
+    SPEECH = 0.5  # well above config.VAD_THRESHOLD
+
+    @pytest.fixture
+    def cb(self, listen_mode):
+        """Fresh recording state with VAD on; returns feed(frames, amplitude, status=None)"""
+        listen = listen_mode(rec_buf=np.empty((1024, 1), dtype=np.float32), rec_frames=[0],
+                             overflows=[0], lvl=[0.0], level_bucket=[-1],
+                             draw_event=threading.Event(), stop_evt=threading.Event(),
+                             CHANNELS=1, vad_enabled=True, vad_threshold_sq=0.015 ** 2,
+                             vad_silence_frames=4 * self.BLOCK, vad_speech=[False],
+                             vad_silent=[0])
+
+        def feed(frames, amplitude, status=None):
+            block = np.full((frames, 1), amplitude, dtype=np.float32)
+            listen.audio_cb(block, frames, None, status)
+        feed.listen = listen
+        return feed
+
+    def test_vad_waits_for_speech(self, cb):
+        """Test that leading silence never stops the recording"""
+        cb(20 * self.BLOCK, 0.0)
+        assert not cb.listen.stop_evt.is_set()
+
+    def test_vad_stops_at_silence_frames(self, cb):
+        """Test that stop fires once vad_silence_frames of silence follow speech"""
+        cb(self.BLOCK, self.SPEECH)
+        for _ in range(3):
+            cb(self.BLOCK, 0.0)
+        assert not cb.listen.stop_evt.is_set()
+
+        cb(self.BLOCK, 0.0)
+        assert cb.listen.stop_evt.is_set()
+        assert cb.listen.vad_silent[0] == cb.listen.vad_silence_frames
+
+    def test_vad_silence_resets_on_speech(self, cb):
+        """Test that speech resuming restarts the silence count"""
+        cb(self.BLOCK, self.SPEECH)
+        for _ in range(3):
+            cb(self.BLOCK, 0.0)
+        cb(self.BLOCK, self.SPEECH)
+        assert cb.listen.vad_silent[0] == 0
+
+        for _ in range(3):
+            cb(self.BLOCK, 0.0)
+        assert not cb.listen.stop_evt.is_set()
+
+    def test_buffer_regrow_keeps_samples(self, cb):
+        """Test that samples recorded before the buffer doubles survive the copy"""
+        listen = cb.listen
+        for i in range(10):
+            cb(300, float(i))
+
+        assert listen.rec_frames[0] == 3000
+        assert len(listen.rec_buf) >= 3000
+        expected = np.repeat(np.arange(10, dtype=np.float32), 300)
+        assert np.array_equal(listen.rec_buf[:3000, 0], expected)
+
+    def test_input_overflow_logged(self, cb, listen_mode, capsys):
+        """Test that a PortAudio input overflow is counted and logged"""
+        listen_mode(verbose=True)
+
+        cb(self.BLOCK, 0.0, types.SimpleNamespace(input_overflow=False))
+        cb(self.BLOCK, 0.0, types.SimpleNamespace(input_overflow=True))
+
+        assert cb.listen.overflows[0] == 1
+        assert 'Input overflow' in capsys.readouterr().err
+
+    def test_level_alpha_tracks_time_constant(self, listen_module):
+        """Test that the meter's EMA weight is derived from LEVEL_TAU and CHUNK_SIZE"""
+        block = listen_module.CHUNK_SIZE / listen_module.SAMPLE_RATE
+        # After LEVEL_TAU seconds of blocks a step input reaches 1 - 1/e
+        blocks = listen_module.LEVEL_TAU / block
+        assert (1 - listen_module.LEVEL_ALPHA) ** blocks == pytest.approx(math.exp(-1))
+
+
+class TestTrimSilence:
+    """Test trimming of leading/trailing silence from recordings"""
+
+    SR = 16000
+    LOUD = 0.5  # well above config.VAD_THRESHOLD
+
+    @pytest.fixture
+    def trim(self, listen_module):
+        return listen_module.trim_silence
+
+    def clip(self, *parts):
+        """Concatenate (seconds, amplitude) parts into one float32 clip"""
+        return np.concatenate([np.full(int(sec * self.SR), amp, dtype=np.float32)
+                               for sec, amp in parts])
+
+    def test_trims_both_ends_with_margin(self, trim):
+        """Test that 0.2s of margin is kept around the loud part"""
+        data = self.clip((1.0, 0.0), (1.0, self.LOUD), (1.0, 0.0))
+
+        trimmed = trim(data)
+
+        assert len(trimmed) == int(1.4 * self.SR)
+        assert np.shares_memory(trimmed, data)
+        assert trimmed[0] == 0.0 and trimmed[-1] == 0.0
+        assert np.array_equal(trimmed, data[int(0.8 * self.SR):int(2.2 * self.SR)])
+
+    def test_all_silent_unchanged(self, trim):
+        """Test that a clip with nothing above the threshold is passed through"""
+        data = self.clip((2.0, 0.0))
+        assert trim(data) is data
+
+    def test_short_result_unchanged(self, trim):
+        """Test that a clip whose trimmed length would be under 0.3s is passed through"""
+        data = self.clip((0.1, self.LOUD), (0.15, 0.0))
+        assert trim(data) is data
+
+    def test_loud_final_partial_frame_kept(self, trim):
+        """Test that speech in the trailing partial 100ms frame is not cut off"""
+        data = self.clip((1.0, 0.0), (0.3, self.LOUD), (0.5, 0.0), (0.05, self.LOUD))
+
+        trimmed = trim(data)
+
+        assert len(trimmed) == len(data) - int(0.8 * self.SR)
+        assert trimmed[-1] == self.LOUD
+
+    @pytest.mark.parametrize('vad', [False, True])
+    def test_recording_trimmed_only_with_vad(self, listen_mode, vad):
+        """Test that SPACE/signal recordings reach Whisper untrimmed, VAD ones trimmed"""
+        data = self.clip((1.0, 0.0), (1.0, self.LOUD), (1.0, 0.0))
+        sent = []
+        listen = listen_mode(vad_enabled=vad, record=lambda *a: data,
+                             start_preload=lambda *a: None,
+                             transcribe_and_output=lambda audio, *a: sent.append(audio))
 
-        # Temporarily set modes
-        original_json = listen.json_mode
-        original_quiet = listen.quiet_mode
-        original_output = listen.output_file
-
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.txt') as tmp:
-            tmp_path = tmp.name
-
-        try:
-            listen.json_mode = False
-            listen.quiet_mode = True
-            listen.output_file = tmp_path
-
-            # Capture stdout (should still print to stdout)
-            from io import StringIO
-            import sys
-            captured = StringIO()
-            sys.stdout = captured
-
-            # Call output_transcription
-            listen.output_transcription("test output", "es", "tiny")
-
-            # Get stdout
-            sys.stdout = sys.__stdout__
-            stdout_output = captured.getvalue()
-
-            # Verify stdout has the text
-            assert 'test output' in stdout_output
-
-            # Verify file was written
-            with open(tmp_path, 'r') as f:
-                file_content = f.read()
-            assert file_content == 'test output'
-
-        finally:
-            # Restore
-            listen.json_mode = original_json
-            listen.quiet_mode = original_quiet
-            listen.output_file = original_output
-            # Cleanup
-            if os.path.exists(tmp_path):
-                os.unlink(tmp_path)
+        listen.process_recording('en', 'tiny', False, False)
+
+        assert len(sent[0]) == (int(1.4 * self.SR) if vad else len(data))
+
+    def test_shorter_than_one_frame_unchanged(self, trim):
+        """Test that input shorter than one 100ms frame is passed through"""
+        data = self.clip((0.05, self.LOUD))
+        assert trim(data) is data
+
+
+class TestProcessingAnimation:
+    """Test the processing animation around transcription"""
+
+    @pytest.fixture
+    def animate(self, listen_mode):
+        """Run transcribe_and_output with a fake transcribe; returns (run, frames drawn)"""
+        drawn = []
+        listen = listen_mode(quiet_mode=True, draw=lambda *a, **kw: drawn.append(a))
+
+        def run(transcribe, fast):
+            listen_mode(transcribe=transcribe, fast_mode=fast, FASTER_WHISPER_AVAILABLE=fast)
+            state, blink = [True], [0]
+            listen.show_processing_animation(state, listen.pct, blink, False)
+            listen.transcribe_and_output(np.zeros(16, dtype=np.float32), 'en', 'tiny',
+                                         state, blink)
+        return run, drawn
+
+    @staticmethod
+    def slow(audio, model, lang, run=None, blink_state=None):
+        # Three UI ticks outside bytecode, like a native decoder holding the main thread
+        time.sleep(0.3)
+        return {'text': 'done', 'language': lang}
+
+    def test_timer_restored_after_transcription(self, animate):
+        """Test that the SIGALRM handler is put back and the timer disarmed"""
+        run, _ = animate
+        before = signal.getsignal(signal.SIGALRM)
+
+        run(lambda *a, **kw: {'text': 'ok', 'language': 'en'}, fast=False)
+
+        assert signal.getsignal(signal.SIGALRM) is before
+        assert signal.getitimer(signal.ITIMER_REAL) == (0.0, 0.0)
+
+    def test_timer_restored_after_error(self, animate):
+        """Test that a failed transcription also restores the previous handler"""
+        run, _ = animate
+        before = signal.getsignal(signal.SIGALRM)
+
+        def fail(*a, **kw):
+            raise RuntimeError('decoder failed')
+
+        with pytest.raises(SystemExit):
+            run(fail, fast=False)
+
+        assert signal.getsignal(signal.SIGALRM) is before
+        assert signal.getitimer(signal.ITIMER_REAL) == (0.0, 0.0)
+
+    def test_faster_whisper_animates_from_thread(self, animate):
+        """Test that the animation keeps drawing while faster-whisper blocks the main thread"""
+        run, drawn = animate
+        before = signal.getsignal(signal.SIGALRM)
+
+        run(self.slow, fast=True)
+
+        assert drawn
+        assert signal.getsignal(signal.SIGALRM) is before
+
+
+class TestBatchMode:
+    """Test --batch over several files"""
+
+    @pytest.fixture
+    def fake_backend(self, listen_mode, tmp_path):
+        """Transcribe every file to its upper-cased stem; return (dir, calls)"""
+        calls = []
+
+        def transcribe(audio, model, lang, run=None, blink_state=None):
+            calls.append(os.path.basename(audio))
+            return {'text': os.path.basename(audio)[:-4].upper(), 'language': lang}
+
+        listen_mode(transcribe=transcribe, preload_model=lambda *a: None)
+        for name in ('a.wav', 'b.wav'):
+            (tmp_path / name).write_bytes(b'RIFF')
+        return tmp_path, calls
+
+    def test_batch_continues_after_failure(self, listen_cli, fake_backend):
+        """Test that a bad file is reported and the remaining files still run"""
+        d, calls = fake_backend
+        a, bad, b = str(d / 'a.wav'), str(d / 'bad.wav'), str(d / 'b.wav')
+
+        result = listen_cli.run(['--batch', a, bad, b, '-q'])
+
+        assert result.returncode == 1
+        assert calls == ['a.wav', 'b.wav']
+        assert result.stdout.splitlines() == [f'{a}: A', f'{b}: B']
+        assert f'File not found: {bad}' in result.stderr
+        assert '1 of 3 files failed' in result.stderr
+
+    def test_batch_json_includes_file(self, listen_cli, fake_backend):
+        """Test that each JSON result names its input file"""
+        d, _ = fake_backend
+        a, b = str(d / 'a.wav'), str(d / 'b.wav')
+
+        result = listen_cli.run(['--batch', a, b, '-j'])
+
+        assert result.returncode == 0
+        lines = [json.loads(line) for line in result.stdout.splitlines()]
+        assert [(r['file'], r['transcription']) for r in lines] == [(a, 'A'), (b, 'B')]
+
+    def test_batch_output_file(self, listen_cli, fake_backend):
+        """Test that -o holds every result of one batch, replacing old contents"""
+        d, _ = fake_backend
+        a, bad, b = str(d / 'a.wav'), str(d / 'bad.wav'), str(d / 'b.wav')
+        out_path = d / 'out.txt'
+        out_path.write_text('stale')
+
+        # The first file failing must not make the next one append to stale output
+        listen_cli.run(['--batch', bad, a, b, '-q', '-o', str(out_path)])
+
+        assert out_path.read_text() == f'{a}: A\n{b}: B'
+
+    def test_batch_rejects_file_flag(self, listen_cli, fake_backend):
+        """Test that -f together with --batch is an error, not silently dropped"""
+        d, calls = fake_backend
+
+        result = listen_cli.run(['-f', str(d / 'a.wav'), '--batch', str(d / 'b.wav')])
+
+        assert result.returncode == 1
+        assert 'cannot be combined' in result.stderr
+        assert calls == []
 
 
 if __name__ == '__main__':